@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class FieldItemState(Enum):
@@ -7,6 +7,14 @@ class FieldItemState(Enum):
     QUESTIONABLE = 2
 
 
+class FieldItemFlag(IntFlag):
+    HAS_MINE = 1
+    VISIBLE = 2
+    FLAGGED = 4
+    QUESTIONED = 8
+    FATAL = 16
+
+
 class FieldItemVisibility(Enum):
     hidden = 0
     visible = 1
@@ -6,7 +6,8 @@ from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 
-from enums import FieldItemState, GameStatus, GameDifficulty
+from enums import FieldItemState, FieldItemFlag, GameStatus, GameDifficulty
+from history import BoardHistory
 from resources import Images, Sounds
 
 from about import Ui_Dialog
@@ -109,6 +110,7 @@ class FieldItem(QPushButton):
             self.visible = False
 
         self.update()
+        self.parent().record_move()
 
     def show_any_state(self):
         self.visible = True
@@ -125,6 +127,46 @@ class FieldItem(QPushButton):
             self.current_image = parent.images.checked
         self.update()
 
+    def state_code(self):
+        code = FieldItemFlag(0)
+        if self.has_mine:
+            code |= FieldItemFlag.HAS_MINE
+        if self.visible:
+            code |= FieldItemFlag.VISIBLE
+        if self.status == FieldItemState.MINE:
+            code |= FieldItemFlag.FLAGGED
+        elif self.status == FieldItemState.QUESTIONABLE:
+            code |= FieldItemFlag.QUESTIONED
+        if self.was_fatal_item:
+            code |= FieldItemFlag.FATAL
+        return int(code)
+
+    def restore_state(self, code: int):
+        code = FieldItemFlag(code)
+        self.has_mine = FieldItemFlag.HAS_MINE in code
+        self.visible = FieldItemFlag.VISIBLE in code
+        self.was_fatal_item = FieldItemFlag.FATAL in code
+        if FieldItemFlag.FLAGGED in code:
+            self.status = FieldItemState.MINE
+        elif FieldItemFlag.QUESTIONED in code:
+            self.status = FieldItemState.QUESTIONABLE
+        else:
+            self.status = FieldItemState.EMPTY
+
+        # Uncovered cell keeps its status, but shows what calculate() has drawn
+        if self.visible:
+            self.show_any_state()
+            return
+
+        images = self.parent().images
+        if self.status == FieldItemState.MINE:
+            self.current_image = images.flag_red
+        elif self.status == FieldItemState.QUESTIONABLE:
+            self.current_image = images.question
+        else:
+            self.current_image = images.empty
+        self.update()
+
     def calculate(self):
         if self.blocked:
             return
@@ -176,6 +218,9 @@ class GameField(QWidget):
     game_ended = pyqtSignal()
     game_reset = pyqtSignal()
     items_block_released = pyqtSignal()
+    game_paused = pyqtSignal()
+    game_resumed = pyqtSignal()
+    history_changed = pyqtSignal(int, int, bool)
 
     def resizeEvent(self, e: QResizeEvent):
         w, h = e.size().width(), e.size().height()
@@ -200,8 +245,12 @@ class GameField(QWidget):
 
         self.game_status = GameStatus.RUNNING
         self.game_run = False
+        self.game_paused_on_loss = False
+        self.practice_mode = False
         self.first_turn = True
 
+        self.history = BoardHistory()
+
         layout = QGridLayout(self)
         layout.setSpacing(0)
         layout.heightForWidth(True)
@@ -277,6 +326,7 @@ class GameField(QWidget):
             item.update()
             self.items_block_released.emit()
             self.first_turn = False
+            self.record_move()
 
         elif self.game_status == GameStatus.RUNNING:
             self.first_turn = False
@@ -295,18 +345,78 @@ class GameField(QWidget):
         self.game_status = GameStatus.LOST
         # print("You loose!")
         self.game_run = False
-        self.game_ended.emit()
+        if self.practice_mode:
+            # Keep the board as it is, so fatal click may be undone
+            self.game_paused_on_loss = True
+            list(map(FieldItem.show_any_state, filter(lambda i: i.was_fatal_item, self.fieldItems)))
+            self.game_paused.emit()
+        else:
+            self.game_ended.emit()
         self.game_status_changed.emit(self.game_status)
 
+    def set_practice_mode(self, enabled: bool):
+        self.practice_mode = enabled
+        if not enabled and self.game_paused_on_loss:
+            self.game_paused_on_loss = False
+            self.game_ended.emit()
+
+    def board_state(self):
+        return [i.state_code() for i in self.fieldItems]
+
+    def can_rewind(self):
+        return self.game_run or self.game_paused_on_loss
+
+    def record_move(self):
+        if self.can_rewind() and self.history.record(self.board_state()):
+            self.emit_history_changed()
+
+    def emit_history_changed(self):
+        self.history_changed.emit(self.history.position, len(self.history), self.can_rewind())
+
+    def undo(self):
+        self.rewind_to(self.history.position - 1)
+
+    def redo(self):
+        self.rewind_to(self.history.position + 1)
+
+    def rewind_to(self, position: int):
+        if not self.can_rewind() or position == self.history.position:
+            self.emit_history_changed()
+            return
+        changes = self.history.seek(position)
+        # Repaint only the cells that differ from what is shown now
+        for index, code in changes.items():
+            self.fieldItems[index].restore_state(code)
+
+        self.items_with_mines = [i for i in self.fieldItems if i.has_mine]
+        self.mines_found = sum(i.status == FieldItemState.MINE for i in self.fieldItems)
+        self.mines_count_changed.emit(self.mines_found)
+        self.first_turn = not any(i.visible for i in self.fieldItems)
+
+        lost = any(i.was_fatal_item for i in self.items_with_mines)
+        if lost and not self.game_paused_on_loss:
+            self.loose()
+        elif not lost and self.game_paused_on_loss:
+            self.game_status = GameStatus.RUNNING
+            self.game_run = True
+            self.game_paused_on_loss = False
+            self.game_resumed.emit()
+            self.game_status_changed.emit(self.game_status)
+
+        self.emit_history_changed()
+
     def start_game(self):
         self.game_reset.emit()
         self.game_status = GameStatus.RUNNING
         self.game_run = True
         self.first_turn = True
+        self.history.reset(self.board_state())
+        self.emit_history_changed()
         self.game_started.emit()
 
     def stop_game(self):
         self.game_run = False
+        self.emit_history_changed()
         list(map(FieldItem.show_any_state, self.fieldItems))
         self.timer = QTimer(self)
         self.timer.singleShot(3000, self.reset_game)
@@ -319,7 +429,10 @@ class GameField(QWidget):
         list(map(FieldItem.reset, self.fieldItems))
         self.mines_found = 0
         self.game_run = False
+        self.game_paused_on_loss = False
         self.game_status = GameStatus.RUNNING
+        self.history.clear()
+        self.emit_history_changed()
         list(map(FieldItem.reset, self.fieldItems))
         self.place_mines()
         self.game_status_changed.emit(self.game_status)
@@ -377,6 +490,18 @@ class StatusBar(QWidget):
         except Exception:
             pass
 
+    def pause_timer(self):
+        try:
+            self.timer.stop()
+        except Exception:
+            pass
+
+    def resume_timer(self):
+        try:
+            self.timer.start()
+        except Exception:
+            pass
+
     def update_counter(self, value):
         self.mines_counter.display(value)
 
@@ -388,6 +513,21 @@ class StatusBar(QWidget):
     #     return QSize(40, 60)
 
 
+class HistoryScrubber(QSlider):
+    def __init__(self, *args, **kwargs):
+        super(HistoryScrubber, self).__init__(Qt.Horizontal, *args, **kwargs)
+        self.setPageStep(1)
+        self.setTickPosition(QSlider.TicksBelow)
+        self.update_range(0, 0, False)
+
+    def update_range(self, position, moves_count, enabled):
+        self.blockSignals(True)
+        self.setRange(0, moves_count)
+        self.setValue(position)
+        self.blockSignals(False)
+        self.setEnabled(enabled and moves_count > 0)
+
+
 class GameActions(QObject):
     def __init__(self, *args, **kwargs):
         super(GameActions, self).__init__(*args, **kwargs)
@@ -412,6 +552,15 @@ class GameActions(QObject):
         self.toggleSound.setCheckable(True)
         self.toggleSound.setChecked(True)
 
+        self.practiceMode = QAction("Practice mode", self)
+        self.practiceMode.setCheckable(True)
+
+        self.undo = QAction("Undo", self)
+        self.undo.setShortcut(QKeySequence.Undo)
+        self.redo = QAction("Redo", self)
+        self.redo.setShortcut(QKeySequence.Redo)
+        self.update_history_actions(0, 0, False)
+
         self.exit = QAction(QIcon(QPixmap.fromImage(images.close)), "Exit", self)
 
         self.aboutDialog = QAction(QIcon(QPixmap.fromImage(images.about)), "About", self)
@@ -426,6 +575,13 @@ class GameActions(QObject):
         self.medium.triggered.connect(lambda p=parent: parent.set_difficulty(GameDifficulty.MEDIUM))
         self.hard.triggered.connect(lambda p=parent: parent.set_difficulty(GameDifficulty.HARD))
         self.aboutDialog.triggered.connect(parent.show_about_dialog)
+        self.undo.triggered.connect(parent.game_field.undo)
+        self.redo.triggered.connect(parent.game_field.redo)
+        self.practiceMode.toggled.connect(parent.game_field.set_practice_mode)
+
+    def update_history_actions(self, position, moves_count, enabled):
+        self.undo.setEnabled(enabled and position > 0)
+        self.redo.setEnabled(enabled and position < moves_count)
 
     def change_sound_icon(self, val):
         if val:
@@ -444,6 +600,7 @@ class GameMenu(QObject):
         parent_menu.addAction(actions.reset)
 
         parent_menu.addAction(actions.toggleSound)
+        parent_menu.addAction(actions.practiceMode)
 
         difficulty_menu = parent_menu.addMenu("&Difficulty")
         difficulty_menu.addActions(actions.difficulty.actions())
@@ -451,6 +608,10 @@ class GameMenu(QObject):
         parent_menu.addMenu(difficulty_menu)
         parent_menu.addAction(actions.exit)
 
+        edit_menu = self.parent().menuBar().addMenu("&Edit")
+        edit_menu.addAction(actions.undo)
+        edit_menu.addAction(actions.redo)
+
         help_menu = self.parent().menuBar().addMenu("&Help")
         about = actions.aboutDialog
         help_menu.addAction(about)
@@ -474,6 +635,7 @@ class MainWindow(QMainWindow):
 
         height, width, mines_count = self.difficulty.value
         self.game_field = GameField(height=height, width=width, mines_count=mines_count, parent=self)
+        self.game_field.set_practice_mode(self.game_actions.practiceMode.isChecked())
 
         layout = QVBoxLayout(self.mainWidget)
         self.mainWidget.setLayout(layout)
@@ -484,11 +646,19 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self.game_field)
 
+        self.history_scrubber = HistoryScrubber(self)
+        layout.addWidget(self.history_scrubber)
+
         self.game_field.mines_count_changed.connect(self.status_bar.mines_counter.display)
         self.game_field.game_started.connect(self.status_bar.start_timer)
         self.game_field.game_ended.connect(self.status_bar.end_timer)
         self.game_field.game_reset.connect(self.status_bar.reset)
         self.game_field.game_status_changed.connect(self.status_bar.set_smile)
+        self.game_field.game_paused.connect(self.status_bar.pause_timer)
+        self.game_field.game_resumed.connect(self.status_bar.resume_timer)
+        self.game_field.history_changed.connect(self.history_scrubber.update_range)
+        self.game_field.history_changed.connect(self.game_actions.update_history_actions)
+        self.history_scrubber.valueChanged.connect(self.game_field.rewind_to)
 
         self.setCentralWidget(self.mainWidget)
         self.mainWidget.resize = self.game_field.resize
@@ -506,7 +676,8 @@ class MainWindow(QMainWindow):
         self.about_dialog.exec_()
 
 
-app = QApplication(sys.argv)
-window = MainWindow()
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
 
-app.exec_()
+    app.exec_()
@@ -0,0 +1,98 @@
+from collections import deque
+
+# Every cell state code (see enums.FieldItemFlag) fits into CELL_BITS bits
+CELL_BITS = 5
+CELL_MASK = (1 << CELL_BITS) - 1
+
+
+def pack(codes):
+    snapshot = 0
+    for index, code in enumerate(codes):
+        snapshot |= code << (index * CELL_BITS)
+    return snapshot
+
+
+def cell_code(snapshot, index):
+    return (snapshot >> (index * CELL_BITS)) & CELL_MASK
+
+
+class BoardHistory:
+    """
+    Bounded undo/redo buffer of board states.
+
+    The current state is kept as a single bit-packed snapshot, every move is kept
+    as a diff holding only the cells it changed: (index, code before, code after)
+    packed into one int. Oldest moves are dropped once capacity is exceeded.
+    """
+
+    def __init__(self, capacity=500):
+        self.capacity = capacity
+        self.snapshot = 0
+        self.position = 0
+        self.diffs = deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.diffs)
+
+    def clear(self):
+        self.reset([])
+
+    def reset(self, codes):
+        self.snapshot = pack(codes)
+        self.position = 0
+        self.diffs.clear()
+
+    def record(self, codes):
+        snapshot = pack(codes)
+        changed = snapshot ^ self.snapshot
+        if not changed:
+            return False
+
+        diff = []
+        previous = self.snapshot
+        index = 0
+        while changed:
+            if changed & CELL_MASK:
+                before = previous & CELL_MASK
+                after = codes[index]
+                diff.append((index << (2 * CELL_BITS)) | (before << CELL_BITS) | after)
+            changed >>= CELL_BITS
+            previous >>= CELL_BITS
+            index += 1
+
+        # New move discards everything that could have been redone
+        while len(self.diffs) > self.position:
+            self.diffs.pop()
+        self.diffs.append(tuple(diff))
+        self.position = len(self.diffs)
+        self.snapshot = snapshot
+        return True
+
+    def seek(self, position):
+        """Move to given position, return {cell index: code} of cells that differ from the previous state"""
+        position = max(0, min(position, len(self.diffs)))
+        original = {}
+
+        while self.position > position:
+            self.position -= 1
+            self._apply(self.diffs[self.position], original, undo=True)
+        while self.position < position:
+            self._apply(self.diffs[self.position], original, undo=False)
+            self.position += 1
+
+        changes = {}
+        for index, code in original.items():
+            current = cell_code(self.snapshot, index)
+            if current != code:
+                changes[index] = current
+        return changes
+
+    def _apply(self, diff, original, undo):
+        for change in diff:
+            index = change >> (2 * CELL_BITS)
+            before = (change >> CELL_BITS) & CELL_MASK
+            after = change & CELL_MASK
+            if undo:
+                before, after = after, before
+            original.setdefault(index, before)
+            self.snapshot ^= (before ^ after) << (index * CELL_BITS)
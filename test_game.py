@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5.QtMultimedia", exc_type=ImportError)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from enums import FieldItemState
+from game import MainWindow
+
+app = QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def game_field():
+    window = MainWindow()
+    yield window.game_field
+    window.close()
+
+
+def place_single_mine(game_field, y, x):
+    for item in game_field.fieldItems:
+        item.has_mine = False
+    item = game_field.fieldItems2D[y][x]
+    item.has_mine = True
+    game_field.items_with_mines = [item]
+
+
+def board_images(game_field):
+    return [i.current_image for i in game_field.fieldItems]
+
+
+def same_images(first, second):
+    return all(a is b for a, b in zip(first, second))
+
+
+def test_undo_redo_reproduces_uncovered_flagged_cell(game_field):
+    place_single_mine(game_field, 9, 9)
+    game_field.start_game()
+
+    flagged = game_field.fieldItems2D[0][1]
+    flagged.toggle_status()
+    assert flagged.status == FieldItemState.MINE
+    after_flag = board_images(game_field)
+
+    # Cascade from the empty corner uncovers the flagged cell as well
+    game_field.item_clicked(game_field.fieldItems2D[0][0])
+    assert flagged.visible
+    assert flagged.current_image is game_field.images.checked
+    after_click = board_images(game_field)
+
+    game_field.undo()
+    assert flagged.current_image is game_field.images.flag_red
+    assert same_images(board_images(game_field), after_flag)
+
+    game_field.redo()
+    assert flagged.current_image is game_field.images.checked
+    assert same_images(board_images(game_field), after_click)
@@ -0,0 +1,81 @@
+from history import BoardHistory, CELL_BITS, cell_code, pack
+
+
+def test_pack_and_cell_code():
+    codes = [0, 1, 31, 0, 16, 5]
+    snapshot = pack(codes)
+    assert snapshot == sum(code << (i * CELL_BITS) for i, code in enumerate(codes))
+    assert [cell_code(snapshot, i) for i in range(len(codes))] == codes
+
+
+def test_record_without_changes_is_ignored():
+    history = BoardHistory()
+    history.reset([0, 0, 0])
+    assert not history.record([0, 0, 0])
+    assert len(history) == 0
+
+
+def test_diff_holds_only_changed_cells():
+    history = BoardHistory()
+    history.reset([0] * 100)
+    history.record([0] * 50 + [3] + [0] * 49)
+    assert len(history.diffs[0]) == 1
+
+
+def test_seek_returns_only_changed_cells():
+    history = BoardHistory()
+    history.reset([0, 0, 0, 0])
+    history.record([2, 0, 0, 0])
+    history.record([2, 4, 0, 0])
+    history.record([0, 4, 0, 1])
+
+    assert history.seek(1) == {0: 2, 1: 0, 3: 0}
+    assert history.seek(3) == {0: 0, 1: 4, 3: 1}
+    # Cell 0 is changed and changed back on the way, it needs no repaint
+    assert history.seek(0) == {1: 0, 3: 0}
+    assert history.seek(0) == {}
+
+
+def test_seek_is_clamped():
+    history = BoardHistory()
+    history.reset([0])
+    history.record([1])
+    assert history.seek(-5) == {0: 0}
+    assert history.position == 0
+    assert history.seek(10) == {0: 1}
+    assert history.position == 1
+
+
+def test_new_move_drops_redo_entries():
+    history = BoardHistory()
+    history.reset([0, 0])
+    history.record([1, 0])
+    history.record([1, 1])
+    history.seek(1)
+    history.record([1, 2])
+    assert len(history) == 2
+    assert history.position == 2
+    assert history.seek(1) == {1: 0}
+
+
+def test_capacity_evicts_oldest_moves():
+    history = BoardHistory(capacity=3)
+    states = [[i] for i in range(6)]
+    history.reset(states[0])
+    for state in states[1:]:
+        history.record(state)
+
+    assert len(history) == 3
+    assert history.position == 3
+    assert history.seek(0) == {0: 2}
+    assert history.snapshot == pack(states[2])
+
+
+def test_clear():
+    history = BoardHistory()
+    history.reset([1, 2])
+    history.record([2, 2])
+    history.clear()
+    assert len(history) == 0
+    assert history.position == 0
+    assert history.snapshot == 0